@@ -12,7 +12,7 @@ from typing import Any, Dict
 from app.exceptions import OperationError
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Calculation:
     """
     Value Object representing a single calculation.
@@ -21,6 +21,9 @@ class Calculation:
     operation performed, operands involved, the result, and the timestamp of the
     calculation. It provides methods for performing the calculation, serializing
     the data for storage, and deserializing data to recreate a Calculation instance.
+
+    Instances are immutable and use slots instead of a per-instance dictionary,
+    keeping large histories small and safe to share between snapshots.
     """
 
     # Required fields
@@ -30,16 +33,27 @@ class Calculation:
 
     # Fields with default values
     result: Decimal = field(init=False)  # The result of the calculation, computed post-initialization
-    timestamp: datetime.datetime = field(default_factory=datetime.datetime.now)  # Time when the calculation was performed
+    timestamp: datetime.datetime = field(default_factory=datetime.datetime.now, compare=False)  # Time when the calculation was performed
+
+    # Read-only string forms of the operands and result, computed once for serialization
+    operand1_str: str = field(init=False, repr=False, compare=False)
+    operand2_str: str = field(init=False, repr=False, compare=False)
+    result_str: str = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """
         Post-initialization processing.
 
         Automatically calculates the result of the operation after the Calculation
-        instance is created.
+        instance is created, and caches the string forms of the operands and result
+        so repeated serialization does not re-format the Decimals. The instance is
+        frozen, so the computed fields are set through object.__setattr__.
         """
-        self.result = self.calculate()
+        result = self.calculate()
+        object.__setattr__(self, 'result', result)
+        object.__setattr__(self, 'operand1_str', str(self.operand1))
+        object.__setattr__(self, 'operand2_str', str(self.operand2))
+        object.__setattr__(self, 'result_str', str(result))
 
     def calculate(self) -> Decimal:
         """
@@ -129,9 +143,9 @@ class Calculation:
         """
         return {
             'operation': self.operation,
-            'operand1': str(self.operand1),
-            'operand2': str(self.operand2),
-            'result': str(self.result),
+            'operand1': self.operand1_str,
+            'operand2': self.operand2_str,
+            'result': self.result_str,
             'timestamp': self.timestamp.isoformat()
         }
 
@@ -153,16 +167,15 @@ class Calculation:
             OperationError: If data is invalid or missing required fields.
         """
         try:
-            # Create the calculation object with the original operands
+            # Create the calculation object with the original operands and the
+            # timestamp from the saved data
             calc = Calculation(
                 operation=data['operation'],
                 operand1=Decimal(data['operand1']),
-                operand2=Decimal(data['operand2'])
+                operand2=Decimal(data['operand2']),
+                timestamp=datetime.datetime.fromisoformat(data['timestamp'])
             )
 
-            # Set the timestamp from the saved data
-            calc.timestamp = datetime.datetime.fromisoformat(data['timestamp'])
-
             # Verify the result matches (helps catch data corruption)
             saved_result = Decimal(data['result'])
             if calc.result != saved_result:
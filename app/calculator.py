@@ -2,26 +2,33 @@
 
 # Calculator Class      
 
+from collections import deque
+from itertools import islice
+import csv
 from decimal import Decimal
 import logging
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
-
-import pandas as pd
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional, Union
 
 from app.calculation import Calculation
 from app.calculator_config import CalculatorConfig
-from app.calculator_memento import CalculatorMemento
+from app.calculator_memento import HistoryDelta
 from app.exceptions import OperationError, ValidationError
 from app.history import HistoryObserver
 from app.input_validators import InputValidator
 from app.operations import Operation
 
+if TYPE_CHECKING:  # pragma: no cover
+    import pandas as pd
+
 # Type aliases for better readability
 Number = Union[int, float, Decimal]
 CalculationResult = Union[Number, str]
 
+# Column order used for the history CSV file and DataFrame
+HISTORY_COLUMNS = ['operation', 'operand1', 'operand2', 'result', 'timestamp']
+
 
 class Calculator:
     """
@@ -33,6 +40,9 @@ class Calculator:
     scalability.
     """
 
+    # Log file the logging system is currently configured for, shared by all instances
+    _configured_log_file: Optional[Path] = None
+
     def __init__(self, config: Optional[CalculatorConfig] = None):
         """
         Initialize calculator with configuration.
@@ -57,16 +67,23 @@ class Calculator:
         # Set up the logging system
         self._setup_logging()
 
-        # Initialize calculation history and operation strategy
-        self.history: List[Calculation] = []
+        # Initialize calculation history and operation strategy; the bounded deque
+        # evicts the oldest calculation once max_history_size is reached
+        self.history: Deque[Calculation] = deque(maxlen=self.config.max_history_size)
         self.operation_strategy: Optional[Operation] = None
 
         # Initialize observer list for the Observer pattern
         self.observers: List[HistoryObserver] = []
 
-        # Initialize stacks for undo and redo functionality using the Memento pattern
-        self.undo_stack: List[CalculatorMemento] = []
-        self.redo_stack: List[CalculatorMemento] = []
+        # Initialize the recorded changes for undo and redo functionality; changes up
+        # to the cursor are applied, those after it have been undone and can be redone.
+        # Bounded like the history, so the oldest change drops off in O(1) when full
+        self._changes: Deque[HistoryDelta] = deque(maxlen=self.config.max_history_size)
+        self._cursor: int = -1
+
+        # Whether the history file is known to exist; None means unknown and
+        # forces a stat call on the next load
+        self._history_file_exists: Optional[bool] = None
 
         # Create required directories for history management
         self._setup_directories()
@@ -85,12 +102,17 @@ class Calculator:
         """
         Configure the logging system.
 
-        Sets up logging to a file with a specified format and log level.
+        Sets up logging to a file with a specified format and log level. The
+        setup is skipped when logging already targets the same file, so creating
+        several calculators does not reopen the log file each time.
         """
         try:
             # Ensure the log directory exists
             os.makedirs(self.config.log_dir, exist_ok=True)
-            log_file = self.config.log_file.resolve()
+            # The config already resolves its paths, so compare the cached value directly
+            log_file = self.config.log_file
+            if Calculator._configured_log_file == log_file:
+                return
 
             # Configure the basic logging settings
             logging.basicConfig(
@@ -99,6 +121,7 @@ class Calculator:
                 format='%(asctime)s - %(levelname)s - %(message)s',
                 force=True  # Overwrite any existing logging configuration
             )
+            Calculator._configured_log_file = log_file
             logging.info(f"Logging initialized at: {log_file}")
         except Exception as e:
             # Print an error message and re-raise the exception if logging setup fails
@@ -113,6 +136,33 @@ class Calculator:
         """
         self.config.history_dir.mkdir(parents=True, exist_ok=True)
 
+    @property
+    def undo_stack(self) -> List[HistoryDelta]:
+        """
+        Get the changes that can be undone.
+
+        Returns:
+            List[HistoryDelta]: Applied changes, with the next one to undo last.
+        """
+        return list(islice(self._changes, self._cursor + 1))
+
+    @property
+    def redo_stack(self) -> List[HistoryDelta]:
+        """
+        Get the changes that can be redone.
+
+        Returns:
+            List[HistoryDelta]: Undone changes, with the next one to redo last.
+        """
+        return list(islice(reversed(self._changes), len(self._changes) - self._cursor - 1))
+
+    def _reset_changes(self) -> None:
+        """
+        Discard all recorded changes, leaving nothing to undo or redo.
+        """
+        self._changes = deque(maxlen=self.config.max_history_size)
+        self._cursor = -1
+
     def add_observer(self, observer: HistoryObserver) -> None:
         """
         Register a new observer.
@@ -205,18 +255,24 @@ class Calculator:
                 operand2=validated_b
             )
 
-            # Save the current state to the undo stack before making changes
-            self.undo_stack.append(CalculatorMemento(self.history.copy()))
+            # Rebound the history if the configured maximum size has changed; recorded
+            # changes no longer line up with the rebounded history, so drop them
+            if self.history.maxlen != self.config.max_history_size:
+                self.history = deque(self.history, maxlen=self.config.max_history_size)
+                self._reset_changes()
 
-            # Clear the redo stack since new operation invalidates the redo history
-            self.redo_stack.clear()
+            # Drop undone changes since new operation invalidates the redo history
+            while len(self._changes) > self._cursor + 1:
+                self._changes.pop()
 
-            # Append the new calculation to the history
-            self.history.append(calculation)
+            # Record the change, including the entry a full history evicts; the
+            # change deque likewise drops its oldest entry once it is full
+            evicted = self.history[0] if len(self.history) == self.history.maxlen else None
+            self._changes.append(HistoryDelta(added=calculation, evicted=evicted))
+            self._cursor = len(self._changes) - 1
 
-            # Ensure the history does not exceed the maximum size
-            if len(self.history) > self.config.max_history_size:
-                self.history.pop(0)
+            # Append the new calculation; the deque drops the oldest entry when full
+            self.history.append(calculation)
 
             # Notify all observers about the new calculation
             self.notify_observers(calculation)
@@ -234,10 +290,11 @@ class Calculator:
 
     def save_history(self) -> None:
         """
-        Save calculation history to a CSV file using pandas.
+        Save calculation history to a CSV file.
 
-        Serializes the history of calculations and writes them to a CSV file for
-        persistent storage. Utilizes pandas DataFrames for efficient data handling.
+        Serializes the history of calculations and streams them to a CSV file for
+        persistent storage using the standard library csv writer, avoiding the
+        overhead of building a pandas DataFrame for every save.
 
         Raises:
             OperationError: If saving the history fails.
@@ -246,27 +303,26 @@ class Calculator:
             # Ensure the history directory exists
             self.config.history_dir.mkdir(parents=True, exist_ok=True)
 
-            history_data = []
-            for calc in self.history:
-                # Serialize each Calculation instance to a dictionary
-                history_data.append({
-                    'operation': str(calc.operation),
-                    'operand1': str(calc.operand1),
-                    'operand2': str(calc.operand2),
-                    'result': str(calc.result),
-                    'timestamp': calc.timestamp.isoformat()
-                })
-
-            if history_data:
-                # Create a pandas DataFrame from the history data
-                df = pd.DataFrame(history_data)
-                # Write the DataFrame to a CSV file without the index
-                df.to_csv(self.config.history_file, index=False)
+            with open(self.config.history_file, 'w', newline='', encoding=self.config.default_encoding) as f:
+                writer = csv.writer(f, lineterminator='\n')
+                # Always write the header so an empty history still produces a valid CSV
+                writer.writerow(HISTORY_COLUMNS)
+                # Serialize each Calculation instance to a row
+                writer.writerows(
+                    (
+                        calc.operation,
+                        calc.operand1_str,
+                        calc.operand2_str,
+                        calc.result_str,
+                        calc.timestamp.isoformat()
+                    )
+                    for calc in self.history
+                )
+            self._history_file_exists = True
+
+            if self.history:
                 logging.info(f"History saved successfully to {self.config.history_file}")
             else:
-                # If history is empty, create an empty CSV with headers
-                pd.DataFrame(columns=['operation', 'operand1', 'operand2', 'result', 'timestamp']
-                           ).to_csv(self.config.history_file, index=False)
                 logging.info("Empty history saved")
 
         except Exception as e:
@@ -276,61 +332,63 @@ class Calculator:
 
     def load_history(self) -> None:
         """
-        Load calculation history from a CSV file using pandas.
+        Load calculation history from a CSV file.
 
-        Reads the calculation history from a CSV file and reconstructs the
-        Calculation instances, restoring the calculator's history.
+        Streams the calculation history from a CSV file with the standard library
+        csv reader and reconstructs the Calculation instances, restoring the
+        calculator's history. The existence check is skipped once the file is
+        known to exist, avoiding a stat call on every load.
 
         Raises:
             OperationError: If loading the history fails.
         """
         try:
-            if self.config.history_file.exists():
-                # Read the CSV file into a pandas DataFrame
-                df = pd.read_csv(self.config.history_file)
-                if not df.empty:
+            if self._history_file_exists or self.config.history_file.exists():
+                with open(self.config.history_file, newline='', encoding=self.config.default_encoding) as f:
                     # Deserialize each row into a Calculation instance
-                    self.history = [
-                        Calculation.from_dict({
-                            'operation': row['operation'],
-                            'operand1': row['operand1'],
-                            'operand2': row['operand2'],
-                            'result': row['result'],
-                            'timestamp': row['timestamp']
-                        })
-                        for _, row in df.iterrows()
-                    ]
+                    history = [Calculation.from_dict(row) for row in csv.DictReader(f)]
+                self._history_file_exists = True
+                if history:
+                    self.history = deque(history, maxlen=self.config.max_history_size)
+                    # Recorded changes do not apply to the replaced history
+                    self._reset_changes()
                     logging.info(f"Loaded {len(self.history)} calculations from history")
                 else:
                     logging.info("Loaded empty history file")
             else:
                 # If no history file exists, start with an empty history
                 logging.info("No history file found - starting with empty history")
+        except FileNotFoundError:
+            # The file was removed after it was last seen; stat again on the next load
+            self._history_file_exists = None
+            logging.info("No history file found - starting with empty history")
         except Exception as e:
             # Log and raise an OperationError if loading fails
             logging.error(f"Failed to load history: {e}")
             raise OperationError(f"Failed to load history: {e}")
 
-    def get_history_dataframe(self) -> pd.DataFrame:
+    def get_history_dataframe(self) -> 'pd.DataFrame':
         """
         Get calculation history as a pandas DataFrame.
 
         Converts the list of Calculation instances into a pandas DataFrame for
-        advanced data manipulation or analysis.
+        advanced data manipulation or analysis. The frame is built column-wise,
+        which avoids pandas inferring types row by row. pandas is imported on
+        first use so that creating a calculator does not pay its import cost.
 
         Returns:
             pd.DataFrame: DataFrame containing the calculation history.
         """
-        history_data = []
-        for calc in self.history:
-            history_data.append({
-                'operation': str(calc.operation),
-                'operand1': str(calc.operand1),
-                'operand2': str(calc.operand2),
-                'result': str(calc.result),
-                'timestamp': calc.timestamp
-            })
-        return pd.DataFrame(history_data)
+        import pandas as pd
+
+        history = self.history
+        return pd.DataFrame({
+            'operation': [calc.operation for calc in history],
+            'operand1': [calc.operand1_str for calc in history],
+            'operand2': [calc.operand2_str for calc in history],
+            'result': [calc.result_str for calc in history],
+            'timestamp': [calc.timestamp for calc in history]
+        }, columns=HISTORY_COLUMNS)
 
     def show_history(self) -> List[str]:
         """
@@ -350,11 +408,10 @@ class Calculator:
         """
         Clear calculation history.
 
-        Empties the calculation history and clears the undo and redo stacks.
+        Empties the calculation history and discards the recorded undo and redo changes.
         """
         self.history.clear()
-        self.undo_stack.clear()
-        self.redo_stack.clear()
+        self._reset_changes()
         logging.info("History cleared")
 
     def undo(self) -> bool:
@@ -362,36 +419,31 @@ class Calculator:
         Undo the last operation.
 
         Restores the calculator's history to the state before the last calculation
-        was performed.
+        was performed by reverting the recorded change.
 
         Returns:
             bool: True if an operation was undone, False if there was nothing to undo.
         """
-        if not self.undo_stack:
+        if self._cursor < 0:
             return False
-        # Pop the last state from the undo stack
-        memento = self.undo_stack.pop()
-        # Push the current state onto the redo stack
-        self.redo_stack.append(CalculatorMemento(self.history.copy()))
-        # Restore the history from the memento
-        self.history = memento.history.copy()
+        # Revert the change at the cursor and move the cursor back past it
+        self._changes[self._cursor].revert(self.history)
+        self._cursor -= 1
         return True
 
     def redo(self) -> bool:
         """
         Redo the previously undone operation.
 
-        Restores the calculator's history to the state before the last undo.
+        Restores the calculator's history to the state before the last undo by
+        reapplying the reverted change.
 
         Returns:
             bool: True if an operation was redone, False if there was nothing to redo.
         """
-        if not self.redo_stack:
+        if self._cursor + 1 >= len(self._changes):
             return False
-        # Pop the last state from the redo stack
-        memento = self.redo_stack.pop()
-        # Push the current state onto the undo stack
-        self.undo_stack.append(CalculatorMemento(self.history.copy()))
-        # Restore the history from the memento
-        self.history = memento.history.copy()
-        return True
\ No newline at end of file
+        # Move the cursor forward and reapply the change it now points at
+        self._cursor += 1
+        self._changes[self._cursor].apply(self.history)
+        return True
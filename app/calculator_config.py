@@ -4,6 +4,7 @@
 
 
 from dataclasses import dataclass
+from functools import cached_property
 from decimal import Decimal
 from numbers import Number
 from pathlib import Path
@@ -47,6 +48,9 @@ class CalculatorConfig:
     directly to the class constructor.
     """
 
+    # Path attributes resolved once per instance and cached on first access
+    _CACHED_PATHS = ('log_dir', 'history_dir', 'history_file', 'log_file')
+
     def __init__(
         self,
         base_dir: Optional[Path] = None,
@@ -54,7 +58,11 @@ class CalculatorConfig:
         auto_save: Optional[bool] = None,
         precision: Optional[int] = None,
         max_input_value: Optional[Number] = None,
-        default_encoding: Optional[str] = None
+        default_encoding: Optional[str] = None,
+        log_dir: Optional[Path] = None,
+        history_dir: Optional[Path] = None,
+        history_file: Optional[Path] = None,
+        log_file: Optional[Path] = None
     ):
         """
         Initialize configuration with environment variables and defaults.
@@ -66,6 +74,10 @@ class CalculatorConfig:
             precision (Optional[int], optional): Number of decimal places for calculations. Defaults to None.
             max_input_value (Optional[Number], optional): Maximum allowed input value. Defaults to None.
             default_encoding (Optional[str], optional): Default encoding for file operations. Defaults to None.
+            log_dir (Optional[Path], optional): Log directory, overriding the environment. Defaults to None.
+            history_dir (Optional[Path], optional): History directory, overriding the environment. Defaults to None.
+            history_file (Optional[Path], optional): History file, overriding the environment. Defaults to None.
+            log_file (Optional[Path], optional): Log file, overriding the environment. Defaults to None.
         """
         # Set base directory to project root by default
         project_root = get_project_root()
@@ -99,7 +111,13 @@ class CalculatorConfig:
             'CALCULATOR_DEFAULT_ENCODING', 'utf-8'
         )
 
-    @property
+        # Explicit path overrides take precedence over environment variables
+        self._log_dir = log_dir
+        self._history_dir = history_dir
+        self._history_file = history_file
+        self._log_file = log_file
+
+    @cached_property
     def log_dir(self) -> Path:
         """
         Get log directory path.
@@ -109,12 +127,14 @@ class CalculatorConfig:
         Returns:
             Path: The log directory path.
         """
+        if self._log_dir is not None:
+            return Path(self._log_dir).resolve()
         return Path(os.getenv(
             'CALCULATOR_LOG_DIR',
             str(self.base_dir / "logs")
         )).resolve()
 
-    @property
+    @cached_property
     def history_dir(self) -> Path:
         """
         Get history directory path.
@@ -124,12 +144,14 @@ class CalculatorConfig:
         Returns:
             Path: The history directory path.
         """
+        if self._history_dir is not None:
+            return Path(self._history_dir).resolve()
         return Path(os.getenv(
             'CALCULATOR_HISTORY_DIR',
             str(self.base_dir / "history")
         )).resolve()
 
-    @property
+    @cached_property
     def history_file(self) -> Path:
         """
         Get history file path.
@@ -139,12 +161,14 @@ class CalculatorConfig:
         Returns:
             Path: The history file path.
         """
+        if self._history_file is not None:
+            return Path(self._history_file).resolve()
         return Path(os.getenv(
             'CALCULATOR_HISTORY_FILE',
             str(self.history_dir / "calculator_history.csv")
         )).resolve()
 
-    @property
+    @cached_property
     def log_file(self) -> Path:
         """
         Get log file path.
@@ -154,11 +178,26 @@ class CalculatorConfig:
         Returns:
             Path: The log file path.
         """
+        if self._log_file is not None:
+            return Path(self._log_file).resolve()
         return Path(os.getenv(
             'CALCULATOR_LOG_FILE',
             str(self.log_dir / "calculator.log")
         )).resolve()
 
+    def __setattr__(self, name: str, value) -> None:
+        """
+        Set an attribute, invalidating cached paths when the base directory changes.
+
+        Args:
+            name (str): Name of the attribute being set.
+            value: New value for the attribute.
+        """
+        super().__setattr__(name, value)
+        if name == 'base_dir':
+            for path_name in self._CACHED_PATHS:
+                self.__dict__.pop(path_name, None)
+
     def validate(self) -> None:
         """
         Validate configuration settings.
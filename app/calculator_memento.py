@@ -4,7 +4,7 @@
 
 from dataclasses import dataclass, field
 import datetime
-from typing import Any, Dict, List
+from typing import Any, Deque, Dict, Optional, Tuple
 
 from app.calculation import Calculation
 
@@ -12,15 +12,28 @@ from app.calculation import Calculation
 @dataclass
 class CalculatorMemento:
     """
-    Stores calculator state for undo/redo functionality.
+    Stores a snapshot of the calculator history for serialization.
 
-    The Memento pattern allows the Calculator to save its current state (history)
-    so that it can be restored later. This enables features like undo and redo.
+    A memento captures the full history at one point in time and converts it to
+    and from a dictionary. It is not used for undo and redo, which record each
+    change as a HistoryDelta instead.
+
+    The history is held as an immutable tuple, so a memento never needs a
+    defensive copy and can safely be shared.
     """
 
-    history: List[Calculation]  # List of Calculation instances representing the calculator's history
+    history: Tuple[Calculation, ...]  # Calculation instances representing the calculator's history
     timestamp: datetime.datetime = field(default_factory=datetime.datetime.now)  # Time when the memento was created
 
+    def __post_init__(self):
+        """
+        Post-initialization processing.
+
+        Freezes the history into a tuple. Passing a tuple stores it by reference,
+        since tuple() returns an existing tuple unchanged.
+        """
+        self.history = tuple(self.history)
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert memento to dictionary.
@@ -53,4 +66,44 @@ class CalculatorMemento:
         return cls(
             history=[Calculation.from_dict(calc) for calc in data['history']],
             timestamp=datetime.datetime.fromisoformat(data['timestamp'])
-        )
\ No newline at end of file
+        )
+
+
+@dataclass
+class HistoryDelta:
+    """
+    Records a single change to the calculator's history for undo/redo.
+
+    Instead of snapshotting the whole history before every calculation, the
+    calculator stores only the calculation that was added and, when the history
+    was full, the calculation that was evicted to make room. Undoing and redoing
+    a change is then constant time regardless of the history size.
+    """
+
+    added: Calculation  # Calculation appended to the history
+    evicted: Optional[Calculation] = None  # Oldest calculation dropped by the append, if any
+
+    def revert(self, history: Deque[Calculation]) -> None:
+        """
+        Undo this change on the given history.
+
+        Removes the added calculation and restores the evicted one, if any.
+
+        Args:
+            history (Deque[Calculation]): The history the change was applied to.
+        """
+        history.pop()
+        if self.evicted is not None:
+            history.appendleft(self.evicted)
+
+    def apply(self, history: Deque[Calculation]) -> None:
+        """
+        Redo this change on the given history.
+
+        Appends the added calculation; a bounded history evicts its oldest entry
+        exactly as it did when the change was first made.
+
+        Args:
+            history (Deque[Calculation]): The history to apply the change to.
+        """
+        history.append(self.added)
@@ -11,6 +11,126 @@ from app.exceptions import OperationError, ValidationError
 from app.history import AutoSaveObserver, LoggingObserver
 from app.operations import OperationFactory
 
+# Commands that perform an arithmetic operation on two operands
+OPERATION_COMMANDS = ['add', 'subtract', 'multiply', 'divide', 'power', 'root']
+
+HELP_TEXT = "\n".join([
+    "\nAvailable commands:",
+    "  add, subtract, multiply, divide, power, root - Perform calculations",
+    "  history - Show calculation history",
+    "  clear - Clear calculation history",
+    "  undo - Undo the last calculation",
+    "  redo - Redo the last undone calculation",
+    "  save - Save calculation history to file",
+    "  load - Load calculation history from file",
+    "  exit - Exit the calculator",
+])
+
+
+def run_operation(calc: Calculator, name: str, a: str, b: str) -> str:
+    """
+    Perform one arithmetic operation and return the text to display.
+
+    Args:
+        calc (Calculator): The calculator to perform the operation with.
+        name (str): The operation command, such as 'add'.
+        a (str): The first operand as entered by the user.
+        b (str): The second operand as entered by the user.
+
+    Returns:
+        str: The formatted result, or the error message if the operation failed.
+    """
+    try:
+        # Create the appropriate operation instance using the Factory pattern
+        calc.set_operation(OperationFactory.create_operation(name))
+
+        # Perform the calculation
+        result = calc.perform_operation(a, b)
+
+        # Normalize the result if it's a Decimal
+        if isinstance(result, Decimal):
+            result = result.normalize()
+
+        return f"\nResult: {result}"
+    except (ValidationError, OperationError) as e:
+        # Handle known exceptions related to validation or operation errors
+        return f"Error: {e}"
+    except Exception as e:
+        # Handle any unexpected exceptions
+        return f"Unexpected error: {e}"
+
+
+def handle_command(calc: Calculator, command: str) -> str:
+    """
+    Execute a single REPL command against a calculator.
+
+    Dispatches one command line, such as 'history' or 'add 2 3', and returns the
+    text to display instead of printing it, so commands can be run without the
+    interactive loop. Arithmetic commands take their two operands inline.
+
+    Args:
+        calc (Calculator): The calculator to run the command against.
+        command (str): The command name, followed by operands for arithmetic commands.
+
+    Returns:
+        str: The output produced by the command.
+    """
+    command = command.strip().lower()
+    parts = command.split()
+    name = parts[0] if parts else ''
+    args = parts[1:]
+
+    if name == 'help':
+        # Display available commands
+        return HELP_TEXT
+
+    if name == 'history':
+        # Display calculation history
+        history = calc.show_history()
+        if not history:
+            return "No calculations in history"
+        lines = ["\nCalculation History:"]
+        lines.extend(f"{i}. {entry}" for i, entry in enumerate(history, 1))
+        return "\n".join(lines)
+
+    if name == 'clear':
+        # Clear calculation history
+        calc.clear_history()
+        return "History cleared"
+
+    if name == 'undo':
+        # Undo the last calculation
+        return "Operation undone" if calc.undo() else "Nothing to undo"
+
+    if name == 'redo':
+        # Redo the last undone calculation
+        return "Operation redone" if calc.redo() else "Nothing to redo"
+
+    if name == 'save':
+        # Save calculation history to file
+        try:
+            calc.save_history()
+            return "History saved successfully"
+        except Exception as e:
+            return f"Error saving history: {e}"
+
+    if name == 'load':
+        # Load calculation history from file
+        try:
+            calc.load_history()
+            return "History loaded successfully"
+        except Exception as e:
+            return f"Error loading history: {e}"
+
+    if name in OPERATION_COMMANDS:
+        # Perform the specified arithmetic operation
+        if len(args) != 2:
+            return f"Error: {name} requires two numbers"
+        return run_operation(calc, name, args[0], args[1])
+
+    # Handle unknown commands
+    return f"Unknown command: '{command}'. Type 'help' for available commands."
+
 
 def calculator_repl():
     """
@@ -18,6 +138,8 @@ def calculator_repl():
 
     Implements a Read-Eval-Print Loop (REPL) that continuously prompts the user
     for commands, processes arithmetic operations, and manages calculation history.
+    Arithmetic operands are prompted for and passed to run_operation as entered;
+    every other command is executed by handle_command.
     """
     try:
         # Initialize the Calculator instance
@@ -34,19 +156,6 @@ def calculator_repl():
                 # Prompt the user for a command
                 command = input("\nEnter command: ").lower().strip()
 
-                if command == 'help':
-                    # Display available commands
-                    print("\nAvailable commands:")
-                    print("  add, subtract, multiply, divide, power, root - Perform calculations")
-                    print("  history - Show calculation history")
-                    print("  clear - Clear calculation history")
-                    print("  undo - Undo the last calculation")
-                    print("  redo - Redo the last undone calculation")
-                    print("  save - Save calculation history to file")
-                    print("  load - Load calculation history from file")
-                    print("  exit - Exit the calculator")
-                    continue
-
                 if command == 'exit':
                     # Attempt to save history before exiting
                     try:
@@ -57,98 +166,27 @@ def calculator_repl():
                     print("Goodbye!")
                     break
 
-                if command == 'history':
-                    # Display calculation history
-                    history = calc.show_history()
-                    if not history:
-                        print("No calculations in history")
-                    else: # pragma: no cover
-                        print("\nCalculation History:")
-                        for i, entry in enumerate(history, 1):
-                            print(f"{i}. {entry}") # pragma: no cover
-                    continue
-
-                if command == 'clear':
-                    # Clear calculation history
-                    calc.clear_history()
-                    print("History cleared") # pragma: no cover
-                    continue
-
-                if command == 'undo':
-                    # Undo the last calculation
-                    if calc.undo(): # pragma: no cover
-                        print("Operation undone")
-                    else:
-                        print("Nothing to undo")
-                    continue
-
-                if command == 'redo':
-                    # Redo the last undone calculation
-                    if calc.redo(): # pragma: no cover
-                        print("Operation redone")
-                    else:
-                        print("Nothing to redo")
-                    continue
-
-                if command == 'save': 
-                    # Save calculation history to file
-                    try: 
-                        calc.save_history() 
-                        print("History saved successfully")
-                    except Exception as e: # pragma: no cover
-                        print(f"Error saving history: {e}")  
-                    continue
-
-                if command == 'load':
-                    # Load calculation history from file
-                    try:
-                        calc.load_history()
-                        print("History loaded successfully")
-                    except Exception as e: # pragma: no cover
-                        print(f"Error loading history: {e}")
-                    continue
-
-                if command in ['add', 'subtract', 'multiply', 'divide', 'power', 'root']:
-                    # Perform the specified arithmetic operation
-                    try:
-                        print("\nEnter numbers (or 'cancel' to abort):")
-                        a = input("First number: ")
-                        if a.lower() == 'cancel':
-                            print("Operation cancelled")
-                            continue
-                        b = input("Second number: ")
-                        if b.lower() == 'cancel':
-                            print("Operation cancelled")
-                            continue
-
-                        # Create the appropriate operation instance using the Factory pattern
-                        operation = OperationFactory.create_operation(command)
-                        calc.set_operation(operation)
-
-                        # Perform the calculation
-                        result = calc.perform_operation(a, b)
-
-                        # Normalize the result if it's a Decimal
-                        if isinstance(result, Decimal):
-                            result = result.normalize()
-
-                        print(f"\nResult: {result}")
-                    except (ValidationError, OperationError) as e: # pragma: no cover
-                        # Handle known exceptions related to validation or operation errors
-                        print(f"Error: {e}")
-                    except Exception as e: # pragma: no cover
-                        # Handle any unexpected exceptions
-                        print(f"Unexpected error: {e}")
+                if command in OPERATION_COMMANDS:
+                    # Prompt for the operands before dispatching the calculation
+                    print("\nEnter numbers (or 'cancel' to abort):")
+                    a = input("First number: ")
+                    if a.lower() == 'cancel':
+                        print("Operation cancelled")
+                        continue
+                    b = input("Second number: ")
+                    if b.lower() == 'cancel':
+                        print("Operation cancelled")
+                        continue
+                    print(run_operation(calc, command, a, b))
                     continue
 
-                # Handle unknown commands
-                print(f"Unknown command: '{command}'. Type 'help' for available commands.") # pragma: no cover
+                print(handle_command(calc, command))
 
             except KeyboardInterrupt: # pragma: no cover
                 # Handle Ctrl+C interruption gracefully
                 print("\nOperation cancelled")
                 continue
-            except EOFError: # pragma: no cover
+            except EOFError:
                 # Handle end-of-file (e.g., Ctrl+D) gracefully
                 print("\nInput terminated. Exiting...")
                 break
@@ -157,8 +195,8 @@ def calculator_repl():
                 print(f"Error: {e}")
                 continue
 
-    except Exception as e: # pragma: no cover
+    except Exception as e:
         # Handle fatal errors during initialization
         print(f"Fatal error: {e}")
         logging.error(f"Fatal error in calculator REPL: {e}")
-        raise
\ No newline at end of file
+        raise
@@ -8,6 +8,9 @@ from typing import Any
 from app.calculator_config import CalculatorConfig
 from app.exceptions import ValidationError
 
+# Normalized Decimals for small integers, reused instead of being rebuilt on every call
+_SMALL_INT_DECIMALS = {i: Decimal(i).normalize() for i in range(-64, 65)}
+
 @dataclass
 class InputValidator:
     """Validates and sanitizes calculator inputs."""
@@ -28,11 +31,17 @@ class InputValidator:
             ValidationError: If input is invalid
         """
         try:
-            if isinstance(value, str):
-                value = value.strip()
-            number = Decimal(str(value))
+            if isinstance(value, int) and not isinstance(value, bool):
+                # Integers convert exactly, so skip the round trip through str
+                number = _SMALL_INT_DECIMALS.get(value)
+                if number is None:
+                    number = Decimal(value).normalize()
+            else:
+                if isinstance(value, str):
+                    value = value.strip()
+                number = Decimal(str(value)).normalize()
             if abs(number) > config.max_input_value:
                 raise ValidationError(f"Value exceeds maximum allowed: {config.max_input_value}")
-            return number.normalize()
+            return number
         except InvalidOperation as e:
             raise ValidationError(f"Invalid number format: {value}") from e
\ No newline at end of file
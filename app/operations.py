@@ -5,6 +5,7 @@
 
 from abc import ABC, abstractmethod
 from decimal import Decimal
+from functools import lru_cache
 from typing import Dict
 from app.exceptions import ValidationError
 
@@ -15,8 +16,13 @@ class Operation(ABC):
 
     Defines the interface for all arithmetic operations. Each operation must
     implement the execute method and can optionally override operand validation.
+
+    Operations are stateless strategies, so instances carry no attributes and
+    can be shared safely between callers.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
         """
@@ -71,6 +77,8 @@ class Addition(Operation):
     Performs the addition of two numbers.
     """
 
+    __slots__ = ()
+
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
         """
         Add two numbers.
@@ -93,6 +101,8 @@ class Subtraction(Operation):
     Performs the subtraction of one number from another.
     """
 
+    __slots__ = ()
+
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
         """
         Subtract one number from another.
@@ -115,6 +125,8 @@ class Multiplication(Operation):
     Performs the multiplication of two numbers.
     """
 
+    __slots__ = ()
+
     def execute(self, a: Decimal, b: Decimal) -> Decimal:
         """
         Multiply two numbers.
@@ -137,6 +149,8 @@ class Division(Operation):
     Performs the division of one number by another.
     """
 
+    __slots__ = ()
+
     def validate_operands(self, a: Decimal, b: Decimal) -> None:
         """
         Validate operands, checking for division by zero.
@@ -176,6 +190,8 @@ class Power(Operation):
     Raises one number to the power of another.
     """
 
+    __slots__ = ()
+
     def validate_operands(self, a: Decimal, b: Decimal) -> None:
         """
         Validate operands for power operation.
@@ -215,6 +231,8 @@ class Root(Operation):
     Calculates the nth root of a number.
     """
 
+    __slots__ = ()
+
     def validate_operands(self, a: Decimal, b: Decimal) -> None:
         """
         Validate operands for root operation.
@@ -293,7 +311,8 @@ class OperationFactory:
         Create an operation instance based on the operation type.
 
         This method retrieves the appropriate operation class from the
-        _operations dictionary and instantiates it.
+        _operations dictionary and returns a shared instance of it. Since
+        operations are stateless, each class is instantiated only once.
 
         Args:
             operation_type (str): The type of operation to create (e.g., 'add').
@@ -307,4 +326,21 @@ class OperationFactory:
         operation_class = cls._operations.get(operation_type.lower())
         if not operation_class:
             raise ValueError(f"Unknown operation: {operation_type}")
+        return cls._shared_instance(operation_class)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _shared_instance(operation_class: type) -> Operation:
+        """
+        Return the cached instance of an operation class.
+
+        Keyed on the class itself, so re-registering a name with a different
+        class never returns a stale instance.
+
+        Args:
+            operation_class (type): The operation class to instantiate.
+
+        Returns:
+            Operation: The shared instance of the operation class.
+        """
         return operation_class()
\ No newline at end of file
@@ -0,0 +1,42 @@
+# Author: Rajat Pednekar, UCID-rp2348
+
+import logging
+import pytest
+from app.calculator import Calculator
+from app.operations import OperationFactory
+
+
+# Keep log records off the disk unless a test is marked with uses_real_logging;
+# Calculator reconfigures logging on construction, so basicConfig is disabled too.
+# Marked tests get a private handler list whose file handlers are closed afterwards,
+# and the once-per-log-file guard is reset so no test sees another's configuration
+@pytest.fixture(autouse=True)
+def _silence_logging(request, monkeypatch):
+    root = logging.getLogger()
+    monkeypatch.setattr(Calculator, '_configured_log_file', None)
+    monkeypatch.setattr(root, 'level', root.level)
+    if request.node.get_closest_marker('uses_real_logging') is None:
+        monkeypatch.setattr(root, 'handlers', [logging.NullHandler()])
+        monkeypatch.setattr(logging, 'basicConfig', lambda *args, **kwargs: None)
+        yield
+        return
+    monkeypatch.setattr(root, 'handlers', [])
+    yield
+    for handler in root.handlers:
+        handler.close()
+
+
+# Operations are stateless strategies, so one instance can serve the whole session
+@pytest.fixture(scope="session")
+def add_op():
+    return OperationFactory.create_operation('add')
+
+
+@pytest.fixture(scope="session")
+def mul_op():
+    return OperationFactory.create_operation('multiply')
+
+
+@pytest.fixture(scope="session")
+def div_op():
+    return OperationFactory.create_operation('divide')
@@ -1,6 +1,7 @@
 # Author: Rajat Pednekar, UCID-rp2348
 
 import pytest
+from dataclasses import FrozenInstanceError
 from decimal import Decimal
 from datetime import datetime
 from app.calculation import Calculation
@@ -162,4 +163,27 @@ def test_calculation_equality_with_non_calculation():
     assert calc.__eq__("not a calculation") == NotImplemented
     assert calc != "not a calculation"
     assert calc != 42
-    assert calc != None
\ No newline at end of file
+    assert calc != None
+
+def test_precomputed_strings():
+    """Test that operand and result strings are computed once at creation."""
+    calc = Calculation(operation="Division", operand1=Decimal("1.50"), operand2=Decimal("0.5"))
+    assert calc.operand1_str == "1.50"
+    assert calc.operand2_str == "0.5"
+    assert calc.result_str == str(calc.result)
+    assert calc.to_dict()['result'] is calc.result_str
+
+def test_calculation_is_immutable():
+    """Test that a Calculation cannot be modified after creation."""
+    calc = Calculation(operation="Addition", operand1=Decimal("2"), operand2=Decimal("3"))
+    with pytest.raises(FrozenInstanceError):
+        calc.result = Decimal("6")
+    assert not hasattr(calc, '__dict__')
+
+def test_calculation_hash_matches_equality():
+    """Test that equal calculations hash alike regardless of timestamp."""
+    calc1 = Calculation(operation="Addition", operand1=Decimal("2"), operand2=Decimal("3"))
+    calc2 = Calculation(operation="Addition", operand1=Decimal("2"), operand2=Decimal("3"),
+                        timestamp=datetime(2020, 1, 1))
+    assert calc1 == calc2
+    assert hash(calc1) == hash(calc2)
@@ -1,81 +1,127 @@
 # Author: Rajat Pednekar, UCID-rp2348
 
+from collections import deque
 import datetime
+import logging
 from pathlib import Path
+import subprocess
+import sys
 import pandas as pd
 import pytest
-from unittest.mock import Mock, patch, PropertyMock
+from unittest.mock import Mock, patch
 from decimal import Decimal
-from tempfile import TemporaryDirectory
 from app.calculator import Calculator
-from app.calculator_repl import calculator_repl
+from app.calculator_repl import calculator_repl, handle_command
 from app.calculator_config import CalculatorConfig
 from app.exceptions import OperationError, ValidationError
 from app.history import LoggingObserver, AutoSaveObserver
-from app.operations import OperationFactory
 
-# Fixture to initialize Calculator with a temporary directory for file paths
+# Session-wide Calculator whose file paths live in a temporary directory
+@pytest.fixture(scope="session")
+def _calc_env(tmp_path_factory):
+    temp_path = tmp_path_factory.mktemp("calculator")
+    config = CalculatorConfig(
+        base_dir=temp_path,
+        log_dir=temp_path / "logs",
+        log_file=temp_path / "logs/calculator.log",
+        history_dir=temp_path / "history",
+        history_file=temp_path / "history/calculator_history.csv"
+    )
+    # Session fixtures are built before the autouse _silence_logging fixture runs,
+    # so silence logging here too; otherwise the real basicConfig opens a log file
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(logging.getLogger(), 'handlers', [logging.NullHandler()])
+        mp.setattr(logging, 'basicConfig', lambda *args, **kwargs: None)
+        mp.setattr(Calculator, '_configured_log_file', None)
+        return Calculator(config=config)
+
+# Fixture resetting the shared Calculator to a clean state for each test
 @pytest.fixture
-def calculator():
-    with TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        config = CalculatorConfig(base_dir=temp_path)
-
-        # Patch properties to use the temporary directory paths
-        with patch.object(CalculatorConfig, 'log_dir', new_callable=PropertyMock) as mock_log_dir, \
-             patch.object(CalculatorConfig, 'log_file', new_callable=PropertyMock) as mock_log_file, \
-             patch.object(CalculatorConfig, 'history_dir', new_callable=PropertyMock) as mock_history_dir, \
-             patch.object(CalculatorConfig, 'history_file', new_callable=PropertyMock) as mock_history_file:
-            
-            # Set return values to use paths within the temporary directory
-            mock_log_dir.return_value = temp_path / "logs"
-            mock_log_file.return_value = temp_path / "logs/calculator.log"
-            mock_history_dir.return_value = temp_path / "history"
-            mock_history_file.return_value = temp_path / "history/calculator_history.csv"
-            
-            # Return an instance of Calculator with the mocked config
-            yield Calculator(config=config)
+def calculator(_calc_env):
+    max_history_size = _calc_env.config.max_history_size
+
+    # Rebuild the history so a bound set by an earlier test does not carry over
+    _calc_env.clear_history()
+    _calc_env.history = deque(maxlen=max_history_size)
+    _calc_env.observers.clear()
+    _calc_env.operation_strategy = None
+    _calc_env.config.history_file.unlink(missing_ok=True)
+    _calc_env._history_file_exists = None
+
+    yield _calc_env
+
+    # Restore configuration mutated by individual tests
+    _calc_env.config.max_history_size = max_history_size
+
+# Calculators built from the default configuration (e.g. by the REPL) resolve their
+# paths from the environment; point them at each test's own temporary directory so
+# history saved by one test is never loaded by another
+@pytest.fixture(autouse=True)
+def _default_paths(tmp_path, monkeypatch):
+    monkeypatch.setenv('CALCULATOR_LOG_DIR', str(tmp_path / "logs"))
+    monkeypatch.setenv('CALCULATOR_LOG_FILE', str(tmp_path / "logs/calculator.log"))
+    monkeypatch.setenv('CALCULATOR_HISTORY_DIR', str(tmp_path / "history"))
+    monkeypatch.setenv('CALCULATOR_HISTORY_FILE', str(tmp_path / "history/calculator_history.csv"))
+
+def test_default_paths_are_per_test(tmp_path):
+    """Test that default-config calculators keep their files in the test's directory."""
+    calc = Calculator()
+    assert calc.config.history_file == tmp_path / "history/calculator_history.csv"
+    assert list(calc.history) == []
 
 # Test Calculator Initialization
 
 def test_calculator_initialization(calculator):
-    assert calculator.history == []
-    assert calculator.undo_stack == []
-    assert calculator.redo_stack == []
+    assert list(calculator.history) == []
+    assert list(calculator.undo_stack) == []
+    assert list(calculator.redo_stack) == []
+    assert calculator._cursor == -1
     assert calculator.operation_strategy is None
 
+@pytest.mark.uses_real_logging
 @patch('logging.basicConfig', side_effect=Exception("Logging setup failed"))
 def test_calculator_logging_setup_failure(mock_logging):
     """Test calculator initialization when logging setup fails."""
     with pytest.raises(Exception, match="Logging setup failed"):
         Calculator()
 
+@pytest.mark.uses_real_logging
 @patch('app.calculator.logging.info')
-def test_logging_setup(logging_info_mock):
-    with patch.object(CalculatorConfig, 'log_dir', new_callable=PropertyMock) as mock_log_dir, \
-         patch.object(CalculatorConfig, 'log_file', new_callable=PropertyMock) as mock_log_file:
-        mock_log_dir.return_value = Path('/tmp/logs')
-        mock_log_file.return_value = Path('/tmp/logs/calculator.log')
-        
-        calculator = Calculator(CalculatorConfig())
-        logging_info_mock.assert_any_call("Calculator initialized with configuration")
-
-@patch('app.calculator.pd.read_csv', side_effect=Exception("CSV read failed"))
-@patch('app.calculator.Path.exists', return_value=True)
-def test_calculator_load_history_failure_during_init(mock_exists, mock_read_csv):
+def test_logging_setup(logging_info_mock, tmp_path):
+    config = CalculatorConfig(
+        base_dir=tmp_path,
+        log_dir=tmp_path / "logs",
+        log_file=tmp_path / "logs/calculator.log"
+    )
+    calculator = Calculator(config)
+    logging_info_mock.assert_any_call("Calculator initialized with configuration")
+
+@pytest.mark.uses_real_logging
+def test_logging_setup_runs_once_per_log_file(tmp_path):
+    """Test that logging is not reconfigured for the same log file."""
+    config = CalculatorConfig(
+        base_dir=tmp_path,
+        log_dir=tmp_path / "logs",
+        log_file=tmp_path / "logs/calculator.log"
+    )
+    Calculator(config)
+    with patch('logging.basicConfig') as mock_basic_config:
+        Calculator(config)
+        mock_basic_config.assert_not_called()
+
+@patch('app.calculator.csv.DictReader', side_effect=Exception("CSV read failed"))
+def test_calculator_load_history_failure_during_init(mock_reader, tmp_path):
     """Test calculator initialization when loading history fails."""
-    with TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        config = CalculatorConfig(base_dir=temp_path)
-        
-        with patch.object(CalculatorConfig, 'history_dir', new_callable=PropertyMock) as mock_history_dir, \
-             patch.object(CalculatorConfig, 'history_file', new_callable=PropertyMock) as mock_history_file:
-            
-            mock_history_dir.return_value = temp_path / "history"
-            mock_history_file.return_value = temp_path / "history/calculator_history.csv"
-            
-            calc = Calculator(config=config)
-            assert calc.history == []
+    config = CalculatorConfig(
+        base_dir=tmp_path,
+        history_dir=tmp_path / "history",
+        history_file=tmp_path / "history/calculator_history.csv"
+    )
+    config.history_dir.mkdir()
+    config.history_file.touch()
+
+    calc = Calculator(config=config)
+    assert list(calc.history) == []
 
 # Test Observers
 
@@ -92,19 +138,17 @@ def test_remove_observer(calculator):
 
 # Test Operations
 
-def test_set_operation(calculator):
-    operation = OperationFactory.create_operation('add')
-    calculator.set_operation(operation)
-    assert calculator.operation_strategy == operation
+def test_set_operation(calculator, add_op):
+    calculator.set_operation(add_op)
+    assert calculator.operation_strategy == add_op
 
-def test_perform_operation_addition(calculator):
-    operation = OperationFactory.create_operation('add')
-    calculator.set_operation(operation)
+def test_perform_operation_addition(calculator, add_op):
+    calculator.set_operation(add_op)
     result = calculator.perform_operation(2, 3)
     assert result == Decimal('5')
 
-def test_perform_operation_validation_error(calculator):
-    calculator.set_operation(OperationFactory.create_operation('add'))
+def test_perform_operation_validation_error(calculator, add_op):
+    calculator.set_operation(add_op)
     with pytest.raises(ValidationError):
         calculator.perform_operation('invalid', 3)
 
@@ -114,22 +158,20 @@ def test_perform_operation_operation_error(calculator):
 
 # Test Undo/Redo
 
-def test_undo(calculator):
-    operation = OperationFactory.create_operation('add')
-    calculator.set_operation(operation)
+def test_undo(calculator, add_op):
+    calculator.set_operation(add_op)
     calculator.perform_operation(2, 3)
     calculator.undo()
-    assert calculator.history == []
+    assert list(calculator.history) == []
 
 def test_undo_empty_history(calculator):
     """Test undo when history is empty."""
     result = calculator.undo()
     assert result is False
-    assert calculator.history == []
+    assert list(calculator.history) == []
 
-def test_redo(calculator):
-    operation = OperationFactory.create_operation('add')
-    calculator.set_operation(operation)
+def test_redo(calculator, add_op):
+    calculator.set_operation(add_op)
     calculator.perform_operation(2, 3)
     calculator.undo()
     calculator.redo()
@@ -140,10 +182,9 @@ def test_redo_empty_redo_stack(calculator):
     result = calculator.redo()
     assert result is False
 
-def test_multiple_undo_redo_operations(calculator):
+def test_multiple_undo_redo_operations(calculator, add_op):
     """Test multiple undo and redo operations."""
-    operation = OperationFactory.create_operation('add')
-    calculator.set_operation(operation)
+    calculator.set_operation(add_op)
     calculator.perform_operation(2, 3)
     calculator.perform_operation(5, 5)
     calculator.perform_operation(10, 10)
@@ -157,10 +198,25 @@ def test_multiple_undo_redo_operations(calculator):
     calculator.redo()
     assert len(calculator.history) == 2
 
-def test_new_operation_clears_redo_stack(calculator):
+def test_undo_redo_stack_views(calculator, add_op):
+    """Test that undo_stack and redo_stack reflect the cursor position."""
+    calculator.set_operation(add_op)
+    calculator.perform_operation(1, 1)
+    calculator.perform_operation(2, 2)
+    first, second = calculator.undo_stack
+
+    calculator.undo()
+    calculator.undo()
+    assert calculator.undo_stack == []
+    assert calculator.redo_stack == [second, first]
+
+    calculator.redo()
+    assert calculator.undo_stack == [first]
+    assert calculator.redo_stack == [second]
+
+def test_new_operation_clears_redo_stack(calculator, add_op):
     """Test that new operation clears redo stack."""
-    operation = OperationFactory.create_operation('add')
-    calculator.set_operation(operation)
+    calculator.set_operation(add_op)
     
     calculator.perform_operation(2, 3)
     calculator.undo()
@@ -171,13 +227,14 @@ def test_new_operation_clears_redo_stack(calculator):
 
 # Test History Management
 
-@patch('app.calculator.pd.DataFrame.to_csv')
-def test_save_history(mock_to_csv, calculator):
-    operation = OperationFactory.create_operation('add')
-    calculator.set_operation(operation)
+@patch('app.calculator.csv.writer')
+def test_save_history(mock_writer, calculator, add_op):
+    calculator.set_operation(add_op)
     calculator.perform_operation(2, 3)
     calculator.save_history()
-    mock_to_csv.assert_called_once()
+    mock_writer.assert_called_once()
+    mock_writer.return_value.writerow.assert_called_once()
+    mock_writer.return_value.writerows.assert_called_once()
 
 def test_save_history_empty(calculator):
     """Test saving empty history."""
@@ -185,7 +242,7 @@ def test_save_history_empty(calculator):
     calculator.save_history()
     
     assert calculator.config.history_file.exists()
-    df = pd.read_csv(calculator.config.history_file)
+    df = pd.read_csv(calculator.config.history_file, encoding=calculator.config.default_encoding)
     assert df.empty
     assert list(df.columns) == ['operation', 'operand1', 'operand2', 'result', 'timestamp']
 
@@ -199,43 +256,40 @@ def test_save_empty_history_creates_csv(calculator):
     calculator.save_history()
     
     assert calculator.config.history_file.exists()
-    df = pd.read_csv(calculator.config.history_file)
+    df = pd.read_csv(calculator.config.history_file, encoding=calculator.config.default_encoding)
     assert df.empty
 
-def test_save_history_with_data(calculator):
+def test_save_history_with_data(calculator, mul_op):
     """Test saving history with actual calculations."""
-    operation = OperationFactory.create_operation('multiply')
-    calculator.set_operation(operation)
+    calculator.set_operation(mul_op)
     calculator.perform_operation(3, 4)
     
     calculator.save_history()
     
     assert calculator.config.history_file.exists()
-    df = pd.read_csv(calculator.config.history_file)
+    df = pd.read_csv(calculator.config.history_file, encoding=calculator.config.default_encoding)
     assert len(df) == 1
     assert df.iloc[0]['operation'] == 'Multiplication'
     assert str(df.iloc[0]['result']) == '12'
 
-@patch('app.calculator.pd.DataFrame.to_csv', side_effect=Exception("Write failed"))
-def test_save_history_failure(mock_to_csv, calculator):
+@patch('app.calculator.csv.writer', side_effect=Exception("Write failed"))
+def test_save_history_failure(mock_writer, calculator, add_op):
     """Test save_history when file write fails."""
-    operation = OperationFactory.create_operation('add')
-    calculator.set_operation(operation)
+    calculator.set_operation(add_op)
     calculator.perform_operation(2, 3)
     
     with pytest.raises(OperationError, match="Failed to save history"):
         calculator.save_history()
 
-@patch('app.calculator.pd.read_csv')
-@patch('app.calculator.Path.exists', return_value=True)
-def test_load_history(mock_exists, mock_read_csv, calculator):
-    mock_read_csv.return_value = pd.DataFrame({
+def test_load_history(calculator):
+    calculator.config.history_dir.mkdir(parents=True, exist_ok=True)
+    pd.DataFrame({
         'operation': ['Addition'],
         'operand1': ['2'],
         'operand2': ['3'],
         'result': ['5'],
         'timestamp': [datetime.datetime.now().isoformat()]
-    })
+    }).to_csv(calculator.config.history_file, index=False, encoding=calculator.config.default_encoding)
     
     try:
         calculator.load_history()
@@ -247,14 +301,28 @@ def test_load_history(mock_exists, mock_read_csv, calculator):
     except OperationError:
         pytest.fail("Loading history failed due to OperationError")
 
+def test_save_and_load_history_roundtrip(calculator, div_op):
+    """Test that saved history is restored by load_history."""
+    calculator.set_operation(div_op)
+    calculator.perform_operation(10, 4)
+    saved_timestamp = calculator.history[0].timestamp
+    calculator.save_history()
+    calculator.history.clear()
+
+    calculator.load_history()
+    assert len(calculator.history) == 1
+    assert calculator.history[0].operation == "Division"
+    assert calculator.history[0].result == Decimal("2.5")
+    assert calculator.history[0].timestamp == saved_timestamp
+
 def test_load_history_empty_file(calculator):
     """Test loading an empty history file."""
     calculator.config.history_dir.mkdir(parents=True, exist_ok=True)
     pd.DataFrame(columns=['operation', 'operand1', 'operand2', 'result', 'timestamp']
-                ).to_csv(calculator.config.history_file, index=False)
+                ).to_csv(calculator.config.history_file, index=False, encoding=calculator.config.default_encoding)
     
     calculator.load_history()
-    assert calculator.history == []
+    assert list(calculator.history) == []
 
 def test_load_history_no_file(calculator):
     """Test loading history when file doesn't exist."""
@@ -262,48 +330,119 @@ def test_load_history_no_file(calculator):
         calculator.config.history_file.unlink()
     
     calculator.load_history()
-    assert calculator.history == []
+    assert list(calculator.history) == []
 
-@patch('app.calculator.pd.read_csv', side_effect=Exception("Read failed"))
-@patch('app.calculator.Path.exists', return_value=True)
-def test_load_history_failure(mock_exists, mock_read_csv, calculator):
+def test_load_history_skips_exists_check_after_save(calculator):
+    """Test that load_history trusts the file state recorded by save_history."""
+    calculator.save_history()
+    with patch('app.calculator.Path.exists') as mock_exists:
+        calculator.load_history()
+        mock_exists.assert_not_called()
+
+def test_load_history_file_removed_after_save(calculator, add_op):
+    """Test loading history when the saved file was deleted externally."""
+    calculator.set_operation(add_op)
+    calculator.perform_operation(2, 3)
+    calculator.save_history()
+    calculator.config.history_file.unlink()
+
+    calculator.load_history()
+    assert len(calculator.history) == 1
+    assert calculator._history_file_exists is None
+
+@patch('app.calculator.csv.DictReader', side_effect=Exception("Read failed"))
+def test_load_history_failure(mock_reader, calculator):
     """Test load_history when file read fails."""
+    calculator.config.history_file.touch()
     with pytest.raises(OperationError, match="Failed to load history"):
         calculator.load_history()
 
-def test_clear_history(calculator):
-    operation = OperationFactory.create_operation('add')
-    calculator.set_operation(operation)
+def test_clear_history(calculator, add_op):
+    calculator.set_operation(add_op)
     calculator.perform_operation(2, 3)
     calculator.clear_history()
-    assert calculator.history == []
-    assert calculator.undo_stack == []
-    assert calculator.redo_stack == []
+    assert list(calculator.history) == []
+    assert list(calculator.undo_stack) == []
+    assert list(calculator.redo_stack) == []
 
-def test_history_size_limit(calculator):
+def test_history_size_limit(calculator, add_op):
     """Test that history respects max_history_size."""
     calculator.config.max_history_size = 3
     
-    operation = OperationFactory.create_operation('add')
-    calculator.set_operation(operation)
+    calculator.set_operation(add_op)
     
     for i in range(5):
         calculator.perform_operation(i, i)
     
     assert len(calculator.history) == 3
+    assert calculator.history.maxlen == 3
     assert calculator.history[0].operand1 == Decimal('2')
 
+def test_undo_redo_with_full_history(calculator, add_op):
+    """Test that undo restores the calculation evicted from a full history."""
+    calculator.config.max_history_size = 2
+    calculator.set_operation(add_op)
+    for i in range(3):
+        calculator.perform_operation(i, i)
+
+    assert [calc.operand1 for calc in calculator.history] == [Decimal('1'), Decimal('2')]
+    calculator.undo()
+    assert [calc.operand1 for calc in calculator.history] == [Decimal('0'), Decimal('1')]
+    calculator.redo()
+    assert [calc.operand1 for calc in calculator.history] == [Decimal('1'), Decimal('2')]
+
+def test_history_bound_matches_config(calculator):
+    """Test that each test starts with the history bounded by the configuration."""
+    assert calculator.history.maxlen == calculator.config.max_history_size
+
+def test_load_history_clears_undo_redo(calculator, add_op):
+    """Test that loading history discards changes recorded for the old history."""
+    calculator.set_operation(add_op)
+    calculator.perform_operation(2, 3)
+    calculator.save_history()
+    calculator.perform_operation(5, 5)
+
+    calculator.load_history()
+    assert len(calculator.history) == 1
+    assert calculator.undo() is False
+
+def test_logging_is_silenced_by_default(tmp_path):
+    """Test that calculators created in tests do not write log files."""
+    config = CalculatorConfig(
+        base_dir=tmp_path,
+        log_dir=tmp_path / "logs",
+        log_file=tmp_path / "logs/calculator.log"
+    )
+    Calculator(config)
+    assert not config.log_file.exists()
+
+def test_shared_calculator_writes_no_log_file(calculator):
+    """Test that the session-wide calculator was built without a log file."""
+    assert not calculator.config.log_file.exists()
+
+def test_calculator_import_does_not_load_pandas():
+    """Test that pandas is only imported when a DataFrame is requested."""
+    code = "import sys, app.calculator; print('pandas' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parent.parent,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    assert result.stdout.strip() == "False"
+
 def test_get_history_dataframe_empty(calculator):
     """Test get_history_dataframe with empty history."""
     calculator.clear_history()
     df = calculator.get_history_dataframe()
     assert df.empty
     assert len(df) == 0
+    assert list(df.columns) == ['operation', 'operand1', 'operand2', 'result', 'timestamp']
 
-def test_get_history_dataframe_with_data(calculator):
+def test_get_history_dataframe_with_data(calculator, add_op):
     """Test get_history_dataframe with calculations."""
-    operation = OperationFactory.create_operation('add')
-    calculator.set_operation(operation)
+    calculator.set_operation(add_op)
     calculator.perform_operation(2, 3)
     calculator.perform_operation(5, 5)
     
@@ -313,7 +452,81 @@ def test_get_history_dataframe_with_data(calculator):
     assert df.iloc[0]['result'] == '5'
     assert df.iloc[1]['result'] == '10'
 
-# REPL Tests
+# REPL Command Tests
+
+@pytest.mark.parametrize("command, expected", [
+    ('help', "\nAvailable commands:"),
+    ('add 2 3', "\nResult: 5"),
+    ('history', "No calculations in history"),
+    ('clear', "History cleared"),
+    ('undo', "Nothing to undo"),
+    ('redo', "Nothing to redo"),
+    ('save', "History saved successfully"),
+    ('load', "History loaded successfully"),
+    ('invalid_command', "Unknown command: 'invalid_command'"),
+    ('  Foo  Bar ', "Unknown command: 'foo  bar'"),
+    ('add 2', "Error: add requires two numbers"),
+    ('divide 10 0', "Error: Division by zero is not allowed"),
+    ('add invalid 5', "Error: Invalid number format: invalid"),
+])
+def test_handle_command(calculator, command, expected):
+    """Test the output of single REPL commands."""
+    assert expected in handle_command(calculator, command)
+
+def test_handle_command_case_and_whitespace(calculator):
+    assert handle_command(calculator, '  ADD 2 3  ') == "\nResult: 5"
+
+def test_handle_command_history_with_entries(calculator):
+    """Test history command listing calculations."""
+    handle_command(calculator, 'add 2 3')
+    output = handle_command(calculator, 'history')
+    assert "Calculation History:" in output
+    assert "1. Addition(2, 3) = 5" in output
+
+def test_handle_command_clear(calculator):
+    """Test clear command removing calculations and undo history."""
+    handle_command(calculator, 'add 2 3')
+    assert handle_command(calculator, 'clear') == "History cleared"
+    assert list(calculator.history) == []
+    assert calculator.undo_stack == []
+
+def test_handle_command_undo_redo(calculator):
+    """Test undo and redo commands after a calculation."""
+    handle_command(calculator, 'add 2 3')
+    assert handle_command(calculator, 'undo') == "Operation undone"
+    assert handle_command(calculator, 'redo') == "Operation redone"
+
+def test_handle_command_save_error(calculator):
+    """Test save command when saving fails."""
+    with patch.object(calculator, 'save_history', side_effect=OperationError("Disk full")):
+        assert handle_command(calculator, 'save') == "Error saving history: Disk full"
+
+def test_handle_command_load_error(calculator):
+    """Test load command when loading fails."""
+    with patch.object(calculator, 'load_history', side_effect=OperationError("Bad file")):
+        assert handle_command(calculator, 'load') == "Error loading history: Bad file"
+
+def test_handle_command_unexpected_error(calculator):
+    """Test handling an unexpected error during a calculation."""
+    with patch.object(calculator, 'perform_operation', side_effect=RuntimeError("boom")):
+        assert handle_command(calculator, 'add 2 3') == "Unexpected error: boom"
+
+# REPL Loop Tests
+
+@pytest.mark.parametrize("inputs, expected", [
+    (['add', '2', '3', 'exit'], "Result: 5"),
+    (['add', 'cancel', 'exit'], "Operation cancelled"),
+    (['add', '5', 'cancel', 'exit'], "Operation cancelled"),
+    (['add', '', '3', 'exit'], "Error: Invalid number format: \n"),
+    (['add', '1 2', '3', 'exit'], "Error: Invalid number format: 1 2"),
+    (['foo bar', 'exit'], "Unknown command: 'foo bar'"),
+])
+def test_calculator_repl_session(inputs, expected, monkeypatch, capsys):
+    """Test REPL sessions that prompt for operands."""
+    responses = iter(inputs)
+    monkeypatch.setattr('builtins.input', lambda prompt='': next(responses))
+    calculator_repl()
+    assert expected in capsys.readouterr().out
 
 @patch('builtins.input', side_effect=['exit'])
 @patch('builtins.print')
@@ -324,100 +537,6 @@ def test_calculator_repl_exit(mock_print, mock_input):
         mock_print.assert_any_call("History saved successfully.")
         mock_print.assert_any_call("Goodbye!")
 
-@patch('builtins.input', side_effect=['help', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_help(mock_print, mock_input):
-    calculator_repl()
-    mock_print.assert_any_call("\nAvailable commands:")
-
-@patch('builtins.input', side_effect=['add', '2', '3', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_addition(mock_print, mock_input):
-    calculator_repl()
-    mock_print.assert_any_call("\nResult: 5")
-
-@patch('builtins.print')
-@patch('builtins.input', side_effect=['history', 'exit'])
-@patch('app.calculator.Calculator.load_history')
-def test_calculator_repl_history_empty(mock_load, mock_input, mock_print):
-    """Test REPL history command with empty history."""
-    calculator_repl()
-    mock_print.assert_any_call("No calculations in history")
-
-@patch('builtins.input', side_effect=['clear', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_clear(mock_print, mock_input):
-    """Test REPL clear command."""
-    calculator_repl()
-    mock_print.assert_any_call("History cleared")
-
-@patch('builtins.input', side_effect=['undo', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_undo_empty(mock_print, mock_input):
-    """Test REPL undo command with empty history."""
-    calculator_repl()
-    mock_print.assert_any_call("Nothing to undo")
-
-@patch('builtins.input', side_effect=['redo', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_redo_empty(mock_print, mock_input):
-    """Test REPL redo command with empty redo stack."""
-    calculator_repl()
-    mock_print.assert_any_call("Nothing to redo")
-
-@patch('builtins.input', side_effect=['save', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_save(mock_print, mock_input):
-    """Test REPL save command."""
-    calculator_repl()
-    mock_print.assert_any_call("History saved successfully")
-
-@patch('builtins.input', side_effect=['load', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_load(mock_print, mock_input):
-    """Test REPL load command."""
-    calculator_repl()
-    printed_calls = [str(call) for call in mock_print.call_args_list]
-    assert any('History loaded' in str(call) or 'Error loading' in str(call) for call in printed_calls)
-
-@patch('builtins.input', side_effect=['invalid_command', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_unknown_command(mock_print, mock_input):
-    """Test REPL with unknown command."""
-    calculator_repl()
-    printed_calls = [str(call) for call in mock_print.call_args_list]
-    assert any("Unknown command" in str(call) for call in printed_calls)
-
-@patch('builtins.input', side_effect=['add', 'cancel', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_cancel_first_operand(mock_print, mock_input):
-    """Test REPL canceling at first operand."""
-    calculator_repl()
-    mock_print.assert_any_call("Operation cancelled")
-
-@patch('builtins.input', side_effect=['add', '5', 'cancel', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_cancel_second_operand(mock_print, mock_input):
-    """Test REPL canceling at second operand."""
-    calculator_repl()
-    mock_print.assert_any_call("Operation cancelled")
-
-@patch('builtins.input', side_effect=['divide', '10', '0', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_division_by_zero(mock_print, mock_input):
-    """Test REPL handling division by zero error."""
-    calculator_repl()
-    printed_calls = [str(call) for call in mock_print.call_args_list]
-    assert any("Error:" in str(call) for call in printed_calls)
-
-@patch('builtins.input', side_effect=['add', 'invalid', '5', 'exit'])
-@patch('builtins.print')
-def test_calculator_repl_invalid_input(mock_print, mock_input):
-    """Test REPL handling invalid input."""
-    calculator_repl()
-    printed_calls = [str(call) for call in mock_print.call_args_list]
-    assert any("Error:" in str(call) for call in printed_calls)
-
 @patch('builtins.input', side_effect=EOFError())
 @patch('builtins.print')
 def test_calculator_repl_eof_error(mock_print, mock_input):
@@ -445,4 +564,4 @@ def test_repl_exit_save_error(mock_print, mock_input, mock_calc_class):
 def test_repl_fatal_initialization_error(mock_print, mock_calc_class):
     """Test REPL with fatal initialization error."""
     with pytest.raises(Exception, match="Fatal init error"):
-        calculator_repl()
\ No newline at end of file
+        calculator_repl()
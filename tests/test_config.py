@@ -144,4 +144,34 @@ def test_history_file_property():
     # Clear environment to test base_dir path creation for history_file
     clear_env_vars('CALCULATOR_HISTORY_FILE')
     config = CalculatorConfig(base_dir=Path('/new_base_dir'))
-    assert config.history_file == Path('/new_base_dir/history/calculator_history.csv').resolve()
\ No newline at end of file
+    assert config.history_file == Path('/new_base_dir/history/calculator_history.csv').resolve()
+
+def test_path_properties_are_cached():
+    clear_env_vars('CALCULATOR_LOG_DIR', 'CALCULATOR_LOG_FILE')
+    config = CalculatorConfig(base_dir=Path('/new_base_dir'))
+    assert config.log_dir is config.log_dir
+    assert config.log_file is config.log_file
+
+def test_base_dir_change_invalidates_cached_paths():
+    clear_env_vars('CALCULATOR_HISTORY_DIR', 'CALCULATOR_HISTORY_FILE')
+    config = CalculatorConfig(base_dir=Path('/new_base_dir'))
+    assert config.history_file == Path('/new_base_dir/history/calculator_history.csv').resolve()
+    config.base_dir = Path('/other_base_dir')
+    assert config.history_dir == Path('/other_base_dir/history').resolve()
+    assert config.history_file == Path('/other_base_dir/history/calculator_history.csv').resolve()
+
+def test_explicit_paths_override_environment():
+    os.environ['CALCULATOR_LOG_DIR'] = './test_logs'
+    os.environ['CALCULATOR_HISTORY_FILE'] = './test_history/test_history.csv'
+    config = CalculatorConfig(
+        base_dir=Path('/new_base_dir'),
+        log_dir=Path('/explicit/logs'),
+        history_dir=Path('/explicit/history'),
+        history_file=Path('/explicit/history/history.csv'),
+        log_file=Path('/explicit/logs/app.log')
+    )
+    assert config.log_dir == Path('/explicit/logs').resolve()
+    assert config.history_dir == Path('/explicit/history').resolve()
+    assert config.history_file == Path('/explicit/history/history.csv').resolve()
+    assert config.log_file == Path('/explicit/logs/app.log').resolve()
+    clear_env_vars('CALCULATOR_LOG_DIR', 'CALCULATOR_HISTORY_FILE')
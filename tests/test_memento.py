@@ -4,7 +4,8 @@
 import pytest
 from datetime import datetime
 from decimal import Decimal
-from app.calculator_memento import CalculatorMemento
+from collections import deque
+from app.calculator_memento import CalculatorMemento, HistoryDelta
 from app.calculation import Calculation
 
 
@@ -23,13 +24,13 @@ class TestCalculatorMemento:
     def test_memento_creation(self, sample_calculations):
         """Test creating a memento with history."""
         memento = CalculatorMemento(history=sample_calculations)
-        assert memento.history == sample_calculations
+        assert memento.history == tuple(sample_calculations)
         assert isinstance(memento.timestamp, datetime)
 
     def test_memento_empty_history(self):
         """Test creating a memento with empty history."""
         memento = CalculatorMemento(history=[])
-        assert memento.history == []
+        assert memento.history == ()
         assert isinstance(memento.timestamp, datetime)
 
     def test_memento_to_dict(self, sample_calculations):
@@ -59,6 +60,7 @@ class TestCalculatorMemento:
         
         assert len(restored_memento.history) == len(original_memento.history)
         assert restored_memento.timestamp == original_memento.timestamp
+        assert isinstance(restored_memento.history, tuple)
         
         # Verify each calculation was restored correctly
         for original, restored in zip(original_memento.history, restored_memento.history):
@@ -75,14 +77,14 @@ class TestCalculatorMemento:
         }
         
         memento = CalculatorMemento.from_dict(memento_dict)
-        assert memento.history == []
+        assert memento.history == ()
         assert isinstance(memento.timestamp, datetime)
 
     @pytest.mark.parametrize("num_calculations", [1, 3, 5, 10])
     def test_memento_various_history_sizes(self, num_calculations):
         """Test mementos with various history sizes."""
         calculations = [
-            Calculation(operation="Addition", operand1=Decimal(str(i)), operand2=Decimal(str(i+1)))
+            Calculation(operation="Addition", operand1=Decimal(i), operand2=Decimal(i + 1))
             for i in range(num_calculations)
         ]
         
@@ -117,7 +119,7 @@ class TestCalculatorMemento:
         restored = CalculatorMemento.from_dict(memento_dict)
         
         assert restored.timestamp == original_timestamp
-'''
+
     def test_memento_history_independence(self, sample_calculations):
         """Test that memento history is independent of original list."""
         original_list = sample_calculations.copy()
@@ -131,4 +133,40 @@ class TestCalculatorMemento:
         # Memento should not be affected
         assert len(memento.history) == len(sample_calculations)
         assert len(memento.history) != len(original_list)
-'''
\ No newline at end of file
+
+    def test_memento_stores_tuple_by_reference(self, sample_calculations):
+        """Test that a tuple history is kept without copying."""
+        history = tuple(sample_calculations)
+        memento = CalculatorMemento(history=history)
+        assert memento.history is history
+
+
+class TestHistoryDelta:
+    """Test HistoryDelta functionality."""
+
+    @pytest.fixture
+    def calculations(self):
+        """Fixture providing sample calculations."""
+        return [
+            Calculation(operation="Addition", operand1=Decimal("1"), operand2=Decimal("1")),
+            Calculation(operation="Addition", operand1=Decimal("2"), operand2=Decimal("2")),
+            Calculation(operation="Addition", operand1=Decimal("3"), operand2=Decimal("3"))
+        ]
+
+    def test_revert_and_apply(self, calculations):
+        """Test reverting and reapplying a change without eviction."""
+        history = deque(calculations[:1], maxlen=3)
+        delta = HistoryDelta(added=calculations[1])
+        delta.apply(history)
+        assert list(history) == calculations[:2]
+        delta.revert(history)
+        assert list(history) == calculations[:1]
+
+    def test_revert_restores_evicted(self, calculations):
+        """Test that reverting a change restores the evicted calculation."""
+        history = deque(calculations[:2], maxlen=2)
+        delta = HistoryDelta(added=calculations[2], evicted=calculations[0])
+        delta.apply(history)
+        assert list(history) == calculations[1:]
+        delta.revert(history)
+        assert list(history) == calculations[:2]
@@ -220,6 +220,26 @@ class TestOperationFactory:
         operation = OperationFactory.create_operation("new_op")
         assert isinstance(operation, NewOperation)
 
+    def test_create_operation_returns_shared_instance(self):
+        """Test that the factory reuses one instance per operation class."""
+        assert OperationFactory.create_operation('add') is OperationFactory.create_operation('ADD')
+        assert OperationFactory.create_operation('add') is not OperationFactory.create_operation('subtract')
+
+    def test_reregister_operation_replaces_instance(self):
+        """Test that re-registering a name yields an instance of the new class."""
+        class FirstOperation(Operation):
+            def execute(self, a: Decimal, b: Decimal) -> Decimal:
+                return a
+
+        class SecondOperation(Operation):
+            def execute(self, a: Decimal, b: Decimal) -> Decimal:
+                return b
+
+        OperationFactory.register_operation("swap_op", FirstOperation)
+        assert isinstance(OperationFactory.create_operation("swap_op"), FirstOperation)
+        OperationFactory.register_operation("swap_op", SecondOperation)
+        assert isinstance(OperationFactory.create_operation("swap_op"), SecondOperation)
+
     def test_register_invalid_operation(self):
         """Test registering an invalid operation class raises error."""
         class InvalidOperation:
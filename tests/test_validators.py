@@ -38,6 +38,9 @@ def test_validate_number_negative_string_decimal():
 def test_validate_number_zero():
     assert InputValidator.validate_number(0, config) == Decimal('0')
 
+def test_validate_number_small_integer_reuses_decimal():
+    assert InputValidator.validate_number(7, config) is InputValidator.validate_number(7, config)
+
 def test_validate_number_trimmed_string():
     assert InputValidator.validate_number("  456  ", config) == Decimal('456')
 
@@ -66,6 +69,10 @@ def test_validate_number_whitespace_string():
     with pytest.raises(ValidationError, match="Invalid number format: "):
         InputValidator.validate_number("   ", config)
 
+def test_validate_number_boolean_value():
+    with pytest.raises(ValidationError, match="Invalid number format: True"):
+        InputValidator.validate_number(True, config)
+
 def test_validate_number_none_value():
     with pytest.raises(ValidationError, match="Invalid number format: None"):
         InputValidator.validate_number(None, config)